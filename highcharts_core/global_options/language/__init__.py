@@ -493,7 +493,7 @@ class Language(HighchartsMeta):
                                                   f'{value.__class__.__name__}')
             validated = []
             for item in value:
-                if item is None or item == constants.EnforcedNull:
+                if item is None or isinstance(item, constants.EnforcedNullType):
                     validated.append(item)
                 else:
                     validated.append(validators.string(item))
@@ -396,7 +396,7 @@ def get_js_literal(item, careful_validation = False) -> str:
             as_str += f"""'{item}'"""
         else:
             as_str += f"""{item}"""
-    elif item == constants.EnforcedNull or item is None:
+    elif isinstance(item, constants.EnforcedNullType) or item is None:
         as_str += """null"""
     elif HAS_NUMPY and not isinstance(item, (dict, UserDict, Decimal)) and np.isnan(item):
         as_str += """null"""
@@ -234,7 +234,7 @@ class HighchartsMeta(ABC):
         for item in untrimmed:
             if checkers.is_type(item, 'CallbackFunction') and to_json:
                 continue
-            elif item is None or item == constants.EnforcedNull:
+            elif item is None or isinstance(item, constants.EnforcedNullType):
                 if to_json:
                     trimmed.append(None)
                 else:
@@ -299,8 +299,14 @@ class HighchartsMeta(ABC):
         for key in untrimmed:
             context_key = f'{context}.{key}'
             value = untrimmed.get(key, None)
+            # None -> skipped (unless explicitly allowed), without probing the
+            # type-specific branches below
+            if value is None:
+                if to_json and context_key in constants.ALLOWED_NONE_CONTEXTS:
+                    as_dict[key] = None
+                continue
             # bool -> Boolean
-            if isinstance(value, bool):
+            elif isinstance(value, bool):
                 as_dict[key] = value
             # ndarray -> (for json) -> list
             elif HAS_NUMPY and to_json and isinstance(value, np.ndarray):
@@ -550,7 +556,8 @@ class HighchartsMeta(ABC):
                                  for_export = for_export)
 
         for key in as_dict:
-            if as_dict[key] == constants.EnforcedNull or as_dict[key] is None:
+            if as_dict[key] is None or isinstance(as_dict[key],
+                                                  constants.EnforcedNullType):
                 as_dict[key] = None
         try:
             as_json = json.dumps(as_dict, encoding = encoding)
@@ -986,7 +993,7 @@ class JavaScriptDict(UserDict):
         for item in untrimmed:
             if checkers.is_type(item, 'CallbackFunction') and to_json:
                 continue
-            elif item is None or item == constants.EnforcedNull:
+            elif item is None or isinstance(item, constants.EnforcedNullType):
                 trimmed.append('null')
             elif hasattr(item, 'trim_dict'):
                 updated_context = item.__class__.__name__
@@ -1186,7 +1193,8 @@ class JavaScriptDict(UserDict):
                                  for_export = for_export)
 
         for key in as_dict:
-            if as_dict[key] == constants.EnforcedNull or as_dict[key] is None:
+            if as_dict[key] is None or isinstance(as_dict[key],
+                                                  constants.EnforcedNullType):
                 as_dict[key] = None
 
         try:
@@ -5,22 +5,27 @@ from validator_collection import validators
 from highcharts_core import constants
 from highcharts_core.decorators import class_sensitive
 from highcharts_core.metaclasses import HighchartsMeta
+from highcharts_core.utility_functions import build_key_map, get_kwargs_from_key_map
 from highcharts_core.utility_classes.javascript_functions import CallbackFunction
 
+_KWARG_KEYS = (
+    ('after_chart_format', 'afterChartFormat'),
+    ('after_chart_formatter', 'afterChartFormatter'),
+    ('axis_range_date_format', 'axisRangeDateFormat'),
+    ('before_chart_format', 'beforeChartFormat'),
+    ('before_chart_formatter', 'beforeChartFormatter'),
+    ('on_play_as_sound_click', 'onPlayAsSoundClick'),
+    ('on_view_data_table_click', 'onViewDataTableClick'),
+)
+
+_KWARG_KEY_MAP = build_key_map(_KWARG_KEYS)
+
 
 class ScreenReaderSection(HighchartsMeta):
     """Accessibility options for the screen reader information sections added before
     and after the chart."""
 
     def __init__(self, **kwargs):
-        self._after_chart_format = None
-        self._after_chart_formatter = None
-        self._axis_range_date_format = None
-        self._before_chart_format = None
-        self._before_chart_formatter = None
-        self._on_play_as_sound_click = None
-        self._on_view_data_table_click = None
-
         self.after_chart_format = kwargs.get('after_chart_format', None)
         self.after_chart_formatter = kwargs.get('after_chart_formatter', None)
         self.axis_range_date_format = kwargs.get('axis_range_date_format', None)
@@ -70,6 +75,8 @@ class ScreenReaderSection(HighchartsMeta):
             self._after_chart_format = None
         elif not value:
             self._after_chart_format = ''
+        elif isinstance(value, str):
+            self._after_chart_format = value
         else:
             self._after_chart_format = validators.string(value, allow_empty = False)
 
@@ -112,7 +119,10 @@ class ScreenReaderSection(HighchartsMeta):
 
     @axis_range_date_format.setter
     def axis_range_date_format(self, value):
-        self._axis_range_date_format = validators.string(value, allow_empty = True)
+        if isinstance(value, str):
+            self._axis_range_date_format = value or None
+        else:
+            self._axis_range_date_format = validators.string(value, allow_empty = True)
 
     @property
     def before_chart_format(self) -> Optional[str]:
@@ -163,6 +173,8 @@ class ScreenReaderSection(HighchartsMeta):
             self._before_chart_format = None
         elif not value:
             self._before_chart_format = ''
+        elif isinstance(value, str):
+            self._before_chart_format = value
         else:
             self._before_chart_format = validators.string(value, allow_empty = False)
 
@@ -227,15 +239,7 @@ class ScreenReaderSection(HighchartsMeta):
 
     @classmethod
     def _get_kwargs_from_dict(cls, as_dict):
-        kwargs = {
-            'after_chart_format': as_dict.get('afterChartFormat', None),
-            'after_chart_formatter': as_dict.get('afterChartFormatter', None),
-            'axis_range_date_format': as_dict.get('axisRangeDateFormat', None),
-            'before_chart_format': as_dict.get('beforeChartFormat', None),
-            'before_chart_formatter': as_dict.get('beforeChartFormatter', None),
-            'on_play_as_sound_click': as_dict.get('onPlayAsSoundClick', None),
-            'on_view_data_table_click': as_dict.get('onViewDataTableClick', None)
-        }
+        kwargs = get_kwargs_from_key_map(as_dict, _KWARG_KEY_MAP)
 
         return kwargs
 
@@ -5,17 +5,22 @@ from validator_collection import validators
 
 from highcharts_core import errors
 from highcharts_core.metaclasses import HighchartsMeta
+from highcharts_core.utility_functions import build_key_map, get_kwargs_from_key_map
+
+_KWARG_KEYS = (
+    ('x', 'x'),
+    ('x_axis', 'xAxis'),
+    ('y', 'y'),
+    ('y_axis', 'yAxis'),
+)
+
+_KWARG_KEY_MAP = build_key_map(_KWARG_KEYS)
 
 
 class AnnotationPoint(HighchartsMeta):
     """Object representation of a shape point."""
 
     def __init__(self, **kwargs):
-        self._x = None
-        self._x_axis = None
-        self._y = None
-        self._y_axis = None
-
         self.x = kwargs.get('x', None)
         self.x_axis = kwargs.get('x_axis', None)
         self.y = kwargs.get('y', None)
@@ -41,7 +46,15 @@ class AnnotationPoint(HighchartsMeta):
 
     @x.setter
     def x(self, value):
-        self._x = validators.numeric(value, allow_empty = True)
+        if value is None or isinstance(value, (int, float, Decimal)):
+            self._x = value
+        elif isinstance(value, str):
+            try:
+                self._x = float(value)
+            except ValueError:
+                self._x = validators.numeric(value, allow_empty = True)
+        else:
+            self._x = validators.numeric(value, allow_empty = True)
 
     @property
     def x_axis(self) -> Optional[str | int]:
@@ -62,6 +75,13 @@ class AnnotationPoint(HighchartsMeta):
     def x_axis(self, value):
         if value is None or value == '':
             self._x_axis = None
+        elif isinstance(value, int):
+            self._x_axis = value
+        elif (
+            isinstance(value, str) and
+            (value[1:] if value[0] == '-' else value).isdecimal()
+        ):
+            self._x_axis = int(value)
         else:
             try:
                 try:
@@ -84,7 +104,15 @@ class AnnotationPoint(HighchartsMeta):
 
     @y.setter
     def y(self, value):
-        self._y = validators.numeric(value, allow_empty = True)
+        if value is None or isinstance(value, (int, float, Decimal)):
+            self._y = value
+        elif isinstance(value, str):
+            try:
+                self._y = float(value)
+            except ValueError:
+                self._y = validators.numeric(value, allow_empty = True)
+        else:
+            self._y = validators.numeric(value, allow_empty = True)
 
     @property
     def y_axis(self) -> Optional[str | int]:
@@ -105,6 +133,13 @@ class AnnotationPoint(HighchartsMeta):
     def y_axis(self, value):
         if value is None or value == '':
             self._y_axis = None
+        elif isinstance(value, int):
+            self._y_axis = value
+        elif (
+            isinstance(value, str) and
+            (value[1:] if value[0] == '-' else value).isdecimal()
+        ):
+            self._y_axis = int(value)
         else:
             try:
                 try:
@@ -117,12 +152,7 @@ class AnnotationPoint(HighchartsMeta):
 
     @classmethod
     def _get_kwargs_from_dict(cls, as_dict):
-        kwargs = {
-            'x': as_dict.get('x', None),
-            'x_axis': as_dict.get('xAxis', None),
-            'y': as_dict.get('y', None),
-            'y_axis': as_dict.get('yAxis', None)
-        }
+        kwargs = get_kwargs_from_key_map(as_dict, _KWARG_KEY_MAP)
 
         return kwargs
 
@@ -762,7 +762,7 @@ class GenericTypeOptions(HighchartsMeta):
 
     @threshold.setter
     def threshold(self, value):
-        if value == constants.EnforcedNull:
+        if isinstance(value, constants.EnforcedNullType):
             self._threshold = constants.EnforcedNull
         else:
             self._threshold = validators.numeric(value, allow_empty = True)
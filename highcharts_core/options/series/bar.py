@@ -21,7 +21,148 @@ from highcharts_core.options.plot_options.bar import (BaseBarOptions,
                                                       WaterfallOptions,
                                                       WindBarbOptions, 
                                                       XRangeOptions)
-from highcharts_core.utility_functions import mro__to_untrimmed_dict, is_ndarray
+from highcharts_core.utility_functions import (mro__to_untrimmed_dict,
+                                               build_key_map,
+                                               get_kwargs_from_key_map,
+                                               data_from_array)
+
+_BASE_BAR_KEYS = (
+    ('accessibility', 'accessibility'),
+    ('allow_point_select', 'allowPointSelect'),
+    ('animation', 'animation'),
+    ('class_name', 'className'),
+    ('clip', 'clip'),
+    ('color', 'color'),
+    ('cursor', 'cursor'),
+    ('custom', 'custom'),
+    ('dash_style', 'dashStyle'),
+    ('data_labels', 'dataLabels'),
+    ('description', 'description'),
+    ('enable_mouse_tracking', 'enableMouseTracking'),
+    ('events', 'events'),
+    ('include_in_data_export', 'includeInDataExport'),
+    ('keys', 'keys'),
+    ('label', 'label'),
+    ('legend_symbol', 'legendSymbol'),
+    ('linked_to', 'linkedTo'),
+    ('marker', 'marker'),
+    ('on_point', 'onPoint'),
+    ('opacity', 'opacity'),
+    ('point', 'point'),
+    ('point_description_formatter', 'pointDescriptionFormatter'),
+    ('selected', 'selected'),
+    ('show_checkbox', 'showCheckbox'),
+    ('show_in_legend', 'showInLegend'),
+    ('skip_keyboard_navigation', 'skipKeyboardNavigation'),
+    ('sonification', 'sonification'),
+    ('states', 'states'),
+    ('sticky_tracking', 'stickyTracking'),
+    ('threshold', 'threshold'),
+    ('tooltip', 'tooltip'),
+    ('turbo_threshold', 'turboThreshold'),
+    ('visible', 'visible'),
+
+    ('animation_limit', 'animationLimit'),
+    ('boost_blending', 'boostBlending'),
+    ('boost_threshold', 'boostThreshold'),
+    ('color_axis', 'colorAxis'),
+    ('color_index', 'colorIndex'),
+    ('color_key', 'colorKey'),
+    ('connect_ends', 'connectEnds'),
+    ('connect_nulls', 'connectNulls'),
+    ('crisp', 'crisp'),
+    ('crop_threshold', 'cropThreshold'),
+    ('data_sorting', 'dataSorting'),
+    ('drag_drop', 'dragDrop'),
+    ('fill_color', 'fillColor'),
+    ('fill_opacity', 'fillOpacity'),
+    ('find_nearest_point_by', 'findNearestPointBy'),
+    ('get_extremes_from_all', 'getExtremesFromAll'),
+    ('inactive_other_points', 'inactiveOtherPoints'),
+    ('linecap', 'linecap'),
+    ('line_color', 'lineColor'),
+    ('line_width', 'lineWidth'),
+    ('negative_color', 'negativeColor'),
+    ('negative_fill_color', 'negativeFillColor'),
+    ('point_interval', 'pointInterval'),
+    ('point_interval_unit', 'pointIntervalUnit'),
+    ('point_placement', 'pointPlacement'),
+    ('point_start', 'pointStart'),
+    ('relative_x_value', 'relativeXValue'),
+    ('shadow', 'shadow'),
+    ('soft_threshold', 'softThreshold'),
+    ('stacking', 'stacking'),
+    ('step', 'step'),
+    ('track_by_area', 'trackByArea'),
+    ('zone_axis', 'zoneAxis'),
+    ('zones', 'zones'),
+
+    ('border_color', 'borderColor'),
+    ('border_radius', 'borderRadius'),
+    ('border_width', 'borderWidth'),
+    ('center_in_category', 'centerInCategory'),
+    ('color_by_point', 'colorByPoint'),
+    ('colors', 'colors'),
+    ('grouping', 'grouping'),
+    ('group_padding', 'groupPadding'),
+    ('max_point_width', 'maxPointWidth'),
+    ('min_point_length', 'minPointLength'),
+    ('point_padding', 'pointPadding'),
+    ('point_range', 'pointRange'),
+    ('point_width', 'pointWidth'),
+
+    ('data', 'data'),
+    ('id', 'id'),
+    ('index', 'index'),
+    ('legend_index', 'legendIndex'),
+    ('name', 'name'),
+    ('stack', 'stack'),
+    ('x_axis', 'xAxis'),
+    ('y_axis', 'yAxis'),
+    ('z_index', 'zIndex'),
+)
+
+_BAR_KEYS = (
+    ('depth', 'depth'),
+    ('edge_color', 'edgeColor'),
+    ('edge_width', 'edgeWidth'),
+    ('group_z_padding', 'groupZPadding'),
+)
+
+_WATERFALL_KEYS = (
+    ('up_color', 'upColor'),
+)
+
+_XRANGE_KEYS = (
+    ('group_z_padding', 'groupZPadding'),
+    ('partial_fill', 'partialFill'),
+)
+
+_WINDBARB_KEYS = (
+    ('point_description_format', 'pointDescriptionFormat'),
+
+    ('data_grouping', 'dataGrouping'),
+    ('on_series', 'onSeries'),
+    ('vector_length', 'vectorLength'),
+    ('x_offset', 'xOffset'),
+    ('y_offset', 'yOffset'),
+)
+
+_WINDBARB_EXCLUDED_KEYS = (
+    'fill_color',
+    'fill_opacity',
+    'line_color',
+    'negative_fill_color',
+    'track_by_area',
+)
+
+
+_BASE_BAR_KEY_MAP = build_key_map(_BASE_BAR_KEYS)
+_BAR_KEY_MAP = build_key_map(_BASE_BAR_KEYS, _BAR_KEYS)
+_WATERFALL_KEY_MAP = build_key_map(_BASE_BAR_KEYS, _BAR_KEYS, _WATERFALL_KEYS)
+_WINDBARB_KEY_MAP = build_key_map(_BASE_BAR_KEYS, _BAR_KEYS, _WINDBARB_KEYS,
+                                   exclude = _WINDBARB_EXCLUDED_KEYS)
+_XRANGE_KEY_MAP = build_key_map(_BASE_BAR_KEYS, _XRANGE_KEYS)
 
 
 class BaseBarSeries(SeriesBase, BaseBarOptions):
@@ -119,108 +260,11 @@ class BaseBarSeries(SeriesBase, BaseBarOptions):
 
     @data.setter
     def data(self, value):
-        if not is_ndarray(value) and not value:
-            self._data = None
-        else:
-            self._data = BarData.from_array(value)
+        self._data = data_from_array(BarData, value)
 
     @classmethod
     def _get_kwargs_from_dict(cls, as_dict):
-        kwargs = {
-            'accessibility': as_dict.get('accessibility', None),
-            'allow_point_select': as_dict.get('allowPointSelect', None),
-            'animation': as_dict.get('animation', None),
-            'class_name': as_dict.get('className', None),
-            'clip': as_dict.get('clip', None),
-            'color': as_dict.get('color', None),
-            'cursor': as_dict.get('cursor', None),
-            'custom': as_dict.get('custom', None),
-            'dash_style': as_dict.get('dashStyle', None),
-            'data_labels': as_dict.get('dataLabels', None),
-            'description': as_dict.get('description', None),
-            'enable_mouse_tracking': as_dict.get('enableMouseTracking', None),
-            'events': as_dict.get('events', None),
-            'include_in_data_export': as_dict.get('includeInDataExport', None),
-            'keys': as_dict.get('keys', None),
-            'label': as_dict.get('label', None),
-            'legend_symbol': as_dict.get('legendSymbol', None),
-            'linked_to': as_dict.get('linkedTo', None),
-            'marker': as_dict.get('marker', None),
-            'on_point': as_dict.get('onPoint', None),
-            'opacity': as_dict.get('opacity', None),
-            'point': as_dict.get('point', None),
-            'point_description_formatter': as_dict.get('pointDescriptionFormatter', None),
-            'selected': as_dict.get('selected', None),
-            'show_checkbox': as_dict.get('showCheckbox', None),
-            'show_in_legend': as_dict.get('showInLegend', None),
-            'skip_keyboard_navigation': as_dict.get('skipKeyboardNavigation', None),
-            'sonification': as_dict.get('sonification', None),
-            'states': as_dict.get('states', None),
-            'sticky_tracking': as_dict.get('stickyTracking', None),
-            'threshold': as_dict.get('threshold', None),
-            'tooltip': as_dict.get('tooltip', None),
-            'turbo_threshold': as_dict.get('turboThreshold', None),
-            'visible': as_dict.get('visible', None),
-
-            'animation_limit': as_dict.get('animationLimit', None),
-            'boost_blending': as_dict.get('boostBlending', None),
-            'boost_threshold': as_dict.get('boostThreshold', None),
-            'color_axis': as_dict.get('colorAxis', None),
-            'color_index': as_dict.get('colorIndex', None),
-            'color_key': as_dict.get('colorKey', None),
-            'connect_ends': as_dict.get('connectEnds', None),
-            'connect_nulls': as_dict.get('connectNulls', None),
-            'crisp': as_dict.get('crisp', None),
-            'crop_threshold': as_dict.get('cropThreshold', None),
-            'data_sorting': as_dict.get('dataSorting', None),
-            'drag_drop': as_dict.get('dragDrop', None),
-            'fill_color': as_dict.get('fillColor', None),
-            'fill_opacity': as_dict.get('fillOpacity', None),
-            'find_nearest_point_by': as_dict.get('findNearestPointBy', None),
-            'get_extremes_from_all': as_dict.get('getExtremesFromAll', None),
-            'inactive_other_points': as_dict.get('inactiveOtherPoints', None),
-            'linecap': as_dict.get('linecap', None),
-            'line_color': as_dict.get('lineColor', None),
-            'line_width': as_dict.get('lineWidth', None),
-            'negative_color': as_dict.get('negativeColor', None),
-            'negative_fill_color': as_dict.get('negativeFillColor', None),
-            'point_interval': as_dict.get('pointInterval', None),
-            'point_interval_unit': as_dict.get('pointIntervalUnit', None),
-            'point_placement': as_dict.get('pointPlacement', None),
-            'point_start': as_dict.get('pointStart', None),
-            'relative_x_value': as_dict.get('relativeXValue', None),
-            'shadow': as_dict.get('shadow', None),
-            'soft_threshold': as_dict.get('softThreshold', None),
-            'stacking': as_dict.get('stacking', None),
-            'step': as_dict.get('step', None),
-            'track_by_area': as_dict.get('trackByArea', None),
-            'zone_axis': as_dict.get('zoneAxis', None),
-            'zones': as_dict.get('zones', None),
-
-            'border_color': as_dict.get('borderColor', None),
-            'border_radius': as_dict.get('borderRadius', None),
-            'border_width': as_dict.get('borderWidth', None),
-            'center_in_category': as_dict.get('centerInCategory', None),
-            'color_by_point': as_dict.get('colorByPoint', None),
-            'colors': as_dict.get('colors', None),
-            'grouping': as_dict.get('grouping', None),
-            'group_padding': as_dict.get('groupPadding', None),
-            'max_point_width': as_dict.get('maxPointWidth', None),
-            'min_point_length': as_dict.get('minPointLength', None),
-            'point_padding': as_dict.get('pointPadding', None),
-            'point_range': as_dict.get('pointRange', None),
-            'point_width': as_dict.get('pointWidth', None),
-
-            'data': as_dict.get('data', None),
-            'id': as_dict.get('id', None),
-            'index': as_dict.get('index', None),
-            'legend_index': as_dict.get('legendIndex', None),
-            'name': as_dict.get('name', None),
-            'stack': as_dict.get('stack', None),
-            'x_axis': as_dict.get('xAxis', None),
-            'y_axis': as_dict.get('yAxis', None),
-            'z_index': as_dict.get('zIndex', None),
-        }
+        kwargs = get_kwargs_from_key_map(as_dict, _BASE_BAR_KEY_MAP)
 
         return kwargs
 
@@ -248,106 +292,7 @@ class BarSeries(BaseBarSeries, BarOptions):
 
     @classmethod
     def _get_kwargs_from_dict(cls, as_dict):
-        kwargs = {
-            'accessibility': as_dict.get('accessibility', None),
-            'allow_point_select': as_dict.get('allowPointSelect', None),
-            'animation': as_dict.get('animation', None),
-            'class_name': as_dict.get('className', None),
-            'clip': as_dict.get('clip', None),
-            'color': as_dict.get('color', None),
-            'cursor': as_dict.get('cursor', None),
-            'custom': as_dict.get('custom', None),
-            'dash_style': as_dict.get('dashStyle', None),
-            'data_labels': as_dict.get('dataLabels', None),
-            'description': as_dict.get('description', None),
-            'enable_mouse_tracking': as_dict.get('enableMouseTracking', None),
-            'events': as_dict.get('events', None),
-            'include_in_data_export': as_dict.get('includeInDataExport', None),
-            'keys': as_dict.get('keys', None),
-            'label': as_dict.get('label', None),
-            'legend_symbol': as_dict.get('legendSymbol', None),
-            'linked_to': as_dict.get('linkedTo', None),
-            'marker': as_dict.get('marker', None),
-            'on_point': as_dict.get('onPoint', None),
-            'opacity': as_dict.get('opacity', None),
-            'point': as_dict.get('point', None),
-            'point_description_formatter': as_dict.get('pointDescriptionFormatter', None),
-            'selected': as_dict.get('selected', None),
-            'show_checkbox': as_dict.get('showCheckbox', None),
-            'show_in_legend': as_dict.get('showInLegend', None),
-            'skip_keyboard_navigation': as_dict.get('skipKeyboardNavigation', None),
-            'sonification': as_dict.get('sonification', None),
-            'states': as_dict.get('states', None),
-            'sticky_tracking': as_dict.get('stickyTracking', None),
-            'threshold': as_dict.get('threshold', None),
-            'tooltip': as_dict.get('tooltip', None),
-            'turbo_threshold': as_dict.get('turboThreshold', None),
-            'visible': as_dict.get('visible', None),
-
-            'animation_limit': as_dict.get('animationLimit', None),
-            'boost_blending': as_dict.get('boostBlending', None),
-            'boost_threshold': as_dict.get('boostThreshold', None),
-            'color_axis': as_dict.get('colorAxis', None),
-            'color_index': as_dict.get('colorIndex', None),
-            'color_key': as_dict.get('colorKey', None),
-            'connect_ends': as_dict.get('connectEnds', None),
-            'connect_nulls': as_dict.get('connectNulls', None),
-            'crisp': as_dict.get('crisp', None),
-            'crop_threshold': as_dict.get('cropThreshold', None),
-            'data_sorting': as_dict.get('dataSorting', None),
-            'drag_drop': as_dict.get('dragDrop', None),
-            'fill_color': as_dict.get('fillColor', None),
-            'fill_opacity': as_dict.get('fillOpacity', None),
-            'find_nearest_point_by': as_dict.get('findNearestPointBy', None),
-            'get_extremes_from_all': as_dict.get('getExtremesFromAll', None),
-            'inactive_other_points': as_dict.get('inactiveOtherPoints', None),
-            'linecap': as_dict.get('linecap', None),
-            'line_color': as_dict.get('lineColor', None),
-            'line_width': as_dict.get('lineWidth', None),
-            'negative_color': as_dict.get('negativeColor', None),
-            'negative_fill_color': as_dict.get('negativeFillColor', None),
-            'point_interval': as_dict.get('pointInterval', None),
-            'point_interval_unit': as_dict.get('pointIntervalUnit', None),
-            'point_placement': as_dict.get('pointPlacement', None),
-            'point_start': as_dict.get('pointStart', None),
-            'relative_x_value': as_dict.get('relativeXValue', None),
-            'shadow': as_dict.get('shadow', None),
-            'soft_threshold': as_dict.get('softThreshold', None),
-            'stacking': as_dict.get('stacking', None),
-            'step': as_dict.get('step', None),
-            'track_by_area': as_dict.get('trackByArea', None),
-            'zone_axis': as_dict.get('zoneAxis', None),
-            'zones': as_dict.get('zones', None),
-
-            'border_color': as_dict.get('borderColor', None),
-            'border_radius': as_dict.get('borderRadius', None),
-            'border_width': as_dict.get('borderWidth', None),
-            'center_in_category': as_dict.get('centerInCategory', None),
-            'color_by_point': as_dict.get('colorByPoint', None),
-            'colors': as_dict.get('colors', None),
-            'grouping': as_dict.get('grouping', None),
-            'group_padding': as_dict.get('groupPadding', None),
-            'max_point_width': as_dict.get('maxPointWidth', None),
-            'min_point_length': as_dict.get('minPointLength', None),
-            'point_padding': as_dict.get('pointPadding', None),
-            'point_range': as_dict.get('pointRange', None),
-            'point_width': as_dict.get('pointWidth', None),
-
-            'depth': as_dict.get('depth', None),
-            'edge_color': as_dict.get('edgeColor', None),
-            'edge_width': as_dict.get('edgeWidth', None),
-            'group_z_padding': as_dict.get('groupZPadding', None),
-
-            'data': as_dict.get('data', None),
-            'id': as_dict.get('id', None),
-            'index': as_dict.get('index', None),
-            'legend_index': as_dict.get('legendIndex', None),
-            'name': as_dict.get('name', None),
-            'stack': as_dict.get('stack', None),
-            'x_axis': as_dict.get('xAxis', None),
-            'y_axis': as_dict.get('yAxis', None),
-            'z_index': as_dict.get('zIndex', None),
-        }
+        kwargs = get_kwargs_from_key_map(as_dict, _BAR_KEY_MAP)
 
         return kwargs
 
@@ -489,10 +434,7 @@ class ColumnPyramidSeries(ColumnSeries):
 
     @data.setter
     def data(self, value):
-        if not is_ndarray(value) and not value:
-            self._data = None
-        else:
-            self._data = CartesianData.from_array(value)
+        self._data = data_from_array(CartesianData, value)
 
 
 class ColumnRangeSeries(ColumnSeries):
@@ -609,10 +551,7 @@ class ColumnRangeSeries(ColumnSeries):
 
     @data.setter
     def data(self, value):
-        if not is_ndarray(value) and not value:
-            self._data = None
-        else:
-            self._data = RangeData.from_array(value)
+        self._data = data_from_array(RangeData, value)
 
 
 class CylinderSeries(BarSeries):
@@ -751,10 +690,7 @@ class VariwideSeries(BaseBarSeries):
 
     @data.setter
     def data(self, value):
-        if not is_ndarray(value) and not value:
-            self._data = None
-        else:
-            self._data = Cartesian3DData.from_array(value)
+        self._data = data_from_array(Cartesian3DData, value)
 
 
 class WaterfallSeries(ColumnSeries, WaterfallOptions):
@@ -877,115 +813,11 @@ class WaterfallSeries(ColumnSeries, WaterfallOptions):
 
     @data.setter
     def data(self, value):
-        if not is_ndarray(value) and not value:
-            self._data = None
-        else:
-            self._data = WaterfallData.from_array(value)
+        self._data = data_from_array(WaterfallData, value)
 
     @classmethod
     def _get_kwargs_from_dict(cls, as_dict):
-        kwargs = {
-            'accessibility': as_dict.get('accessibility', None),
-            'allow_point_select': as_dict.get('allowPointSelect', None),
-            'animation': as_dict.get('animation', None),
-            'class_name': as_dict.get('className', None),
-            'clip': as_dict.get('clip', None),
-            'color': as_dict.get('color', None),
-            'cursor': as_dict.get('cursor', None),
-            'custom': as_dict.get('custom', None),
-            'dash_style': as_dict.get('dashStyle', None),
-            'data_labels': as_dict.get('dataLabels', None),
-            'description': as_dict.get('description', None),
-            'enable_mouse_tracking': as_dict.get('enableMouseTracking', None),
-            'events': as_dict.get('events', None),
-            'include_in_data_export': as_dict.get('includeInDataExport', None),
-            'keys': as_dict.get('keys', None),
-            'label': as_dict.get('label', None),
-            'legend_symbol': as_dict.get('legendSymbol', None),
-            'linked_to': as_dict.get('linkedTo', None),
-            'marker': as_dict.get('marker', None),
-            'on_point': as_dict.get('onPoint', None),
-            'opacity': as_dict.get('opacity', None),
-            'point': as_dict.get('point', None),
-            'point_description_formatter': as_dict.get('pointDescriptionFormatter', None),
-            'selected': as_dict.get('selected', None),
-            'show_checkbox': as_dict.get('showCheckbox', None),
-            'show_in_legend': as_dict.get('showInLegend', None),
-            'skip_keyboard_navigation': as_dict.get('skipKeyboardNavigation', None),
-            'sonification': as_dict.get('sonification', None),
-            'states': as_dict.get('states', None),
-            'sticky_tracking': as_dict.get('stickyTracking', None),
-            'threshold': as_dict.get('threshold', None),
-            'tooltip': as_dict.get('tooltip', None),
-            'turbo_threshold': as_dict.get('turboThreshold', None),
-            'visible': as_dict.get('visible', None),
-
-            'animation_limit': as_dict.get('animationLimit', None),
-            'boost_blending': as_dict.get('boostBlending', None),
-            'boost_threshold': as_dict.get('boostThreshold', None),
-            'color_axis': as_dict.get('colorAxis', None),
-            'color_index': as_dict.get('colorIndex', None),
-            'color_key': as_dict.get('colorKey', None),
-            'connect_ends': as_dict.get('connectEnds', None),
-            'connect_nulls': as_dict.get('connectNulls', None),
-            'crisp': as_dict.get('crisp', None),
-            'crop_threshold': as_dict.get('cropThreshold', None),
-            'data_sorting': as_dict.get('dataSorting', None),
-            'drag_drop': as_dict.get('dragDrop', None),
-            'fill_color': as_dict.get('fillColor', None),
-            'fill_opacity': as_dict.get('fillOpacity', None),
-            'find_nearest_point_by': as_dict.get('findNearestPointBy', None),
-            'get_extremes_from_all': as_dict.get('getExtremesFromAll', None),
-            'inactive_other_points': as_dict.get('inactiveOtherPoints', None),
-            'linecap': as_dict.get('linecap', None),
-            'line_color': as_dict.get('lineColor', None),
-            'line_width': as_dict.get('lineWidth', None),
-            'negative_color': as_dict.get('negativeColor', None),
-            'negative_fill_color': as_dict.get('negativeFillColor', None),
-            'point_interval': as_dict.get('pointInterval', None),
-            'point_interval_unit': as_dict.get('pointIntervalUnit', None),
-            'point_placement': as_dict.get('pointPlacement', None),
-            'point_start': as_dict.get('pointStart', None),
-            'relative_x_value': as_dict.get('relativeXValue', None),
-            'shadow': as_dict.get('shadow', None),
-            'soft_threshold': as_dict.get('softThreshold', None),
-            'stacking': as_dict.get('stacking', None),
-            'step': as_dict.get('step', None),
-            'track_by_area': as_dict.get('trackByArea', None),
-            'zone_axis': as_dict.get('zoneAxis', None),
-            'zones': as_dict.get('zones', None),
-
-            'border_color': as_dict.get('borderColor', None),
-            'border_radius': as_dict.get('borderRadius', None),
-            'border_width': as_dict.get('borderWidth', None),
-            'center_in_category': as_dict.get('centerInCategory', None),
-            'color_by_point': as_dict.get('colorByPoint', None),
-            'colors': as_dict.get('colors', None),
-            'grouping': as_dict.get('grouping', None),
-            'group_padding': as_dict.get('groupPadding', None),
-            'max_point_width': as_dict.get('maxPointWidth', None),
-            'min_point_length': as_dict.get('minPointLength', None),
-            'point_padding': as_dict.get('pointPadding', None),
-            'point_range': as_dict.get('pointRange', None),
-            'point_width': as_dict.get('pointWidth', None),
-
-            'depth': as_dict.get('depth', None),
-            'edge_color': as_dict.get('edgeColor', None),
-            'edge_width': as_dict.get('edgeWidth', None),
-            'group_z_padding': as_dict.get('groupZPadding', None),
-
-            'up_color': as_dict.get('upColor', None),
-
-            'data': as_dict.get('data', None),
-            'id': as_dict.get('id', None),
-            'index': as_dict.get('index', None),
-            'legend_index': as_dict.get('legendIndex', None),
-            'name': as_dict.get('name', None),
-            'stack': as_dict.get('stack', None),
-            'x_axis': as_dict.get('xAxis', None),
-            'y_axis': as_dict.get('yAxis', None),
-            'z_index': as_dict.get('zIndex', None),
-        }
+        kwargs = get_kwargs_from_key_map(as_dict, _WATERFALL_KEY_MAP)
 
         return kwargs
 
@@ -1102,115 +934,11 @@ class WindBarbSeries(BarSeries, WindBarbOptions):
 
     @data.setter
     def data(self, value):
-        if not is_ndarray(value) and not value:
-            self._data = None
-        else:
-            self._data = WindBarbData.from_array(value)
+        self._data = data_from_array(WindBarbData, value)
 
     @classmethod
     def _get_kwargs_from_dict(cls, as_dict):
-        kwargs = {
-            'accessibility': as_dict.get('accessibility', None),
-            'allow_point_select': as_dict.get('allowPointSelect', None),
-            'animation': as_dict.get('animation', None),
-            'class_name': as_dict.get('className', None),
-            'clip': as_dict.get('clip', None),
-            'color': as_dict.get('color', None),
-            'cursor': as_dict.get('cursor', None),
-            'custom': as_dict.get('custom', None),
-            'dash_style': as_dict.get('dashStyle', None),
-            'data_labels': as_dict.get('dataLabels', None),
-            'description': as_dict.get('description', None),
-            'enable_mouse_tracking': as_dict.get('enableMouseTracking', None),
-            'events': as_dict.get('events', None),
-            'include_in_data_export': as_dict.get('includeInDataExport', None),
-            'keys': as_dict.get('keys', None),
-            'label': as_dict.get('label', None),
-            'legend_symbol': as_dict.get('legendSymbol', None),
-            'linked_to': as_dict.get('linkedTo', None),
-            'marker': as_dict.get('marker', None),
-            'on_point': as_dict.get('onPoint', None),
-            'opacity': as_dict.get('opacity', None),
-            'point': as_dict.get('point', None),
-            'point_description_formatter': as_dict.get('pointDescriptionFormatter', None),
-            'selected': as_dict.get('selected', None),
-            'show_checkbox': as_dict.get('showCheckbox', None),
-            'show_in_legend': as_dict.get('showInLegend', None),
-            'skip_keyboard_navigation': as_dict.get('skipKeyboardNavigation', None),
-            'sonification': as_dict.get('sonification', None),
-            'states': as_dict.get('states', None),
-            'sticky_tracking': as_dict.get('stickyTracking', None),
-            'threshold': as_dict.get('threshold', None),
-            'tooltip': as_dict.get('tooltip', None),
-            'turbo_threshold': as_dict.get('turboThreshold', None),
-            'visible': as_dict.get('visible', None),
-
-            'animation_limit': as_dict.get('animationLimit', None),
-            'boost_blending': as_dict.get('boostBlending', None),
-            'boost_threshold': as_dict.get('boostThreshold', None),
-            'color_axis': as_dict.get('colorAxis', None),
-            'color_index': as_dict.get('colorIndex', None),
-            'color_key': as_dict.get('colorKey', None),
-            'connect_ends': as_dict.get('connectEnds', None),
-            'connect_nulls': as_dict.get('connectNulls', None),
-            'crisp': as_dict.get('crisp', None),
-            'crop_threshold': as_dict.get('cropThreshold', None),
-            'data_sorting': as_dict.get('dataSorting', None),
-            'drag_drop': as_dict.get('dragDrop', None),
-            'find_nearest_point_by': as_dict.get('findNearestPointBy', None),
-            'get_extremes_from_all': as_dict.get('getExtremesFromAll', None),
-            'inactive_other_points': as_dict.get('inactiveOtherPoints', None),
-            'linecap': as_dict.get('linecap', None),
-            'line_width': as_dict.get('lineWidth', None),
-            'negative_color': as_dict.get('negativeColor', None),
-            'point_description_format': as_dict.get('pointDescriptionFormat', None),
-            'point_interval': as_dict.get('pointInterval', None),
-            'point_interval_unit': as_dict.get('pointIntervalUnit', None),
-            'point_placement': as_dict.get('pointPlacement', None),
-            'point_start': as_dict.get('pointStart', None),
-            'relative_x_value': as_dict.get('relativeXValue', None),
-            'shadow': as_dict.get('shadow', None),
-            'soft_threshold': as_dict.get('softThreshold', None),
-            'stacking': as_dict.get('stacking', None),
-            'step': as_dict.get('step', None),
-            'zone_axis': as_dict.get('zoneAxis', None),
-            'zones': as_dict.get('zones', None),
-
-            'border_color': as_dict.get('borderColor', None),
-            'border_radius': as_dict.get('borderRadius', None),
-            'border_width': as_dict.get('borderWidth', None),
-            'center_in_category': as_dict.get('centerInCategory', None),
-            'color_by_point': as_dict.get('colorByPoint', None),
-            'colors': as_dict.get('colors', None),
-            'grouping': as_dict.get('grouping', None),
-            'group_padding': as_dict.get('groupPadding', None),
-            'max_point_width': as_dict.get('maxPointWidth', None),
-            'min_point_length': as_dict.get('minPointLength', None),
-            'point_padding': as_dict.get('pointPadding', None),
-            'point_range': as_dict.get('pointRange', None),
-            'point_width': as_dict.get('pointWidth', None),
-
-            'depth': as_dict.get('depth', None),
-            'edge_color': as_dict.get('edgeColor', None),
-            'edge_width': as_dict.get('edgeWidth', None),
-            'group_z_padding': as_dict.get('groupZPadding', None),
-
-            'data_grouping': as_dict.get('dataGrouping', None),
-            'on_series': as_dict.get('onSeries', None),
-            'vector_length': as_dict.get('vectorLength', None),
-            'x_offset': as_dict.get('xOffset', None),
-            'y_offset': as_dict.get('yOffset', None),
-
-            'data': as_dict.get('data', None),
-            'id': as_dict.get('id', None),
-            'index': as_dict.get('index', None),
-            'legend_index': as_dict.get('legendIndex', None),
-            'name': as_dict.get('name', None),
-            'stack': as_dict.get('stack', None),
-            'x_axis': as_dict.get('xAxis', None),
-            'y_axis': as_dict.get('yAxis', None),
-            'z_index': as_dict.get('zIndex', None),
-        }
+        kwargs = get_kwargs_from_key_map(as_dict, _WINDBARB_KEY_MAP)
 
         return kwargs
 
@@ -1280,111 +1008,11 @@ class XRangeSeries(BaseBarSeries, XRangeOptions):
 
     @data.setter
     def data(self, value):
-        if not is_ndarray(value) and not value:
-            self._data = None
-        else:
-            self._data = XRangeData.from_array(value)
+        self._data = data_from_array(XRangeData, value)
 
     @classmethod
     def _get_kwargs_from_dict(cls, as_dict):
-        kwargs = {
-            'accessibility': as_dict.get('accessibility', None),
-            'allow_point_select': as_dict.get('allowPointSelect', None),
-            'animation': as_dict.get('animation', None),
-            'class_name': as_dict.get('className', None),
-            'clip': as_dict.get('clip', None),
-            'color': as_dict.get('color', None),
-            'cursor': as_dict.get('cursor', None),
-            'custom': as_dict.get('custom', None),
-            'dash_style': as_dict.get('dashStyle', None),
-            'data_labels': as_dict.get('dataLabels', None),
-            'description': as_dict.get('description', None),
-            'enable_mouse_tracking': as_dict.get('enableMouseTracking', None),
-            'events': as_dict.get('events', None),
-            'include_in_data_export': as_dict.get('includeInDataExport', None),
-            'keys': as_dict.get('keys', None),
-            'label': as_dict.get('label', None),
-            'legend_symbol': as_dict.get('legendSymbol', None),
-            'linked_to': as_dict.get('linkedTo', None),
-            'marker': as_dict.get('marker', None),
-            'on_point': as_dict.get('onPoint', None),
-            'opacity': as_dict.get('opacity', None),
-            'point': as_dict.get('point', None),
-            'point_description_formatter': as_dict.get('pointDescriptionFormatter', None),
-            'selected': as_dict.get('selected', None),
-            'show_checkbox': as_dict.get('showCheckbox', None),
-            'show_in_legend': as_dict.get('showInLegend', None),
-            'skip_keyboard_navigation': as_dict.get('skipKeyboardNavigation', None),
-            'sonification': as_dict.get('sonification', None),
-            'states': as_dict.get('states', None),
-            'sticky_tracking': as_dict.get('stickyTracking', None),
-            'threshold': as_dict.get('threshold', None),
-            'tooltip': as_dict.get('tooltip', None),
-            'turbo_threshold': as_dict.get('turboThreshold', None),
-            'visible': as_dict.get('visible', None),
-
-            'animation_limit': as_dict.get('animationLimit', None),
-            'boost_blending': as_dict.get('boostBlending', None),
-            'boost_threshold': as_dict.get('boostThreshold', None),
-            'color_axis': as_dict.get('colorAxis', None),
-            'color_index': as_dict.get('colorIndex', None),
-            'color_key': as_dict.get('colorKey', None),
-            'connect_ends': as_dict.get('connectEnds', None),
-            'connect_nulls': as_dict.get('connectNulls', None),
-            'crisp': as_dict.get('crisp', None),
-            'crop_threshold': as_dict.get('cropThreshold', None),
-            'data_sorting': as_dict.get('dataSorting', None),
-            'drag_drop': as_dict.get('dragDrop', None),
-            'fill_color': as_dict.get('fillColor', None),
-            'fill_opacity': as_dict.get('fillOpacity', None),
-            'find_nearest_point_by': as_dict.get('findNearestPointBy', None),
-            'get_extremes_from_all': as_dict.get('getExtremesFromAll', None),
-            'inactive_other_points': as_dict.get('inactiveOtherPoints', None),
-            'linecap': as_dict.get('linecap', None),
-            'line_color': as_dict.get('lineColor', None),
-            'line_width': as_dict.get('lineWidth', None),
-            'negative_color': as_dict.get('negativeColor', None),
-            'negative_fill_color': as_dict.get('negativeFillColor', None),
-            'point_interval': as_dict.get('pointInterval', None),
-            'point_interval_unit': as_dict.get('pointIntervalUnit', None),
-            'point_placement': as_dict.get('pointPlacement', None),
-            'point_start': as_dict.get('pointStart', None),
-            'relative_x_value': as_dict.get('relativeXValue', None),
-            'shadow': as_dict.get('shadow', None),
-            'soft_threshold': as_dict.get('softThreshold', None),
-            'stacking': as_dict.get('stacking', None),
-            'step': as_dict.get('step', None),
-            'track_by_area': as_dict.get('trackByArea', None),
-            'zone_axis': as_dict.get('zoneAxis', None),
-            'zones': as_dict.get('zones', None),
-
-            'border_color': as_dict.get('borderColor', None),
-            'border_radius': as_dict.get('borderRadius', None),
-            'border_width': as_dict.get('borderWidth', None),
-            'center_in_category': as_dict.get('centerInCategory', None),
-            'color_by_point': as_dict.get('colorByPoint', None),
-            'colors': as_dict.get('colors', None),
-            'grouping': as_dict.get('grouping', None),
-            'group_padding': as_dict.get('groupPadding', None),
-            'max_point_width': as_dict.get('maxPointWidth', None),
-            'min_point_length': as_dict.get('minPointLength', None),
-            'point_padding': as_dict.get('pointPadding', None),
-            'point_range': as_dict.get('pointRange', None),
-            'point_width': as_dict.get('pointWidth', None),
-
-            'group_z_padding': as_dict.get('groupZPadding', None),
-            'partial_fill': as_dict.get('partialFill', None),
-
-            'data': as_dict.get('data', None),
-            'id': as_dict.get('id', None),
-            'index': as_dict.get('index', None),
-            'legend_index': as_dict.get('legendIndex', None),
-            'name': as_dict.get('name', None),
-            'stack': as_dict.get('stack', None),
-            'x_axis': as_dict.get('xAxis', None),
-            'y_axis': as_dict.get('yAxis', None),
-            'z_index': as_dict.get('zIndex', None),
-        }
+        kwargs = get_kwargs_from_key_map(as_dict, _XRANGE_KEY_MAP)
 
         return kwargs
 
@@ -11,12 +11,60 @@ except ImportError:
     HAS_NUMPY = False
 
 from highcharts_core import constants, errors
+from highcharts_core.utility_functions import build_key_map, get_kwargs_from_key_map
 from highcharts_core.decorators import class_sensitive
 from highcharts_core.options.series.data.cartesian import CartesianData, CartesianDataCollection
 from highcharts_core.utility_classes.gradients import Gradient
 from highcharts_core.utility_classes.patterns import Pattern
 from highcharts_core.utility_classes.partial_fill import PartialFillOptions
 
+_BASE_DATA_KEYS = (
+    ('accessibility', 'accessibility'),
+    ('class_name', 'className'),
+    ('color', 'color'),
+    ('color_index', 'colorIndex'),
+    ('custom', 'custom'),
+    ('description', 'description'),
+    ('events', 'events'),
+    ('id', 'id'),
+    ('name', 'name'),
+    ('selected', 'selected'),
+
+    ('data_labels', 'dataLabels'),
+    ('drag_drop', 'dragDrop'),
+    ('drilldown', 'drilldown'),
+    ('marker', 'marker'),
+    ('x', 'x'),
+    ('y', 'y'),
+)
+
+_BAR_DATA_KEYS = (
+    ('border_color', 'borderColor'),
+    ('border_width', 'borderWidth'),
+    ('dash_style', 'dashStyle'),
+    ('point_width', 'pointWidth'),
+)
+
+_WATERFALL_DATA_KEYS = (
+    ('is_intermediate_sum', 'isIntermediateSum'),
+    ('is_sum', 'isSum'),
+)
+
+_WINDBARB_DATA_KEYS = (
+    ('direction', 'direction'),
+    ('value', 'value'),
+)
+
+_XRANGE_DATA_KEYS = (
+    ('partial_fill', 'partialFill'),
+    ('x2', 'x2'),
+)
+
+_BAR_DATA_KEY_MAP = build_key_map(_BASE_DATA_KEYS, _BAR_DATA_KEYS)
+_WATERFALL_DATA_KEY_MAP = build_key_map(_BASE_DATA_KEYS, _WATERFALL_DATA_KEYS)
+_WINDBARB_DATA_KEY_MAP = build_key_map(_BASE_DATA_KEYS, _WINDBARB_DATA_KEYS)
+_XRANGE_DATA_KEY_MAP = build_key_map(_BASE_DATA_KEYS, _XRANGE_DATA_KEYS)
+
 
 class BarData(CartesianData):
     """Variant of :class:`CartesianData` which is used for data points in a column or bar
@@ -28,10 +76,20 @@ class BarData(CartesianData):
         self._dash_style = None
         self._point_width = None
 
-        self.border_color = kwargs.get('border_color', None)
-        self.border_width = kwargs.get('border_width', None)
-        self.dash_style = kwargs.get('dash_style', None)
-        self.point_width = kwargs.get('point_width', None)
+        # Most bar points set none of these, and each setter maps None to None, so
+        # only dispatch to the setters for values that were actually supplied.
+        border_color = kwargs.get('border_color', None)
+        if border_color is not None:
+            self.border_color = border_color
+        border_width = kwargs.get('border_width', None)
+        if border_width is not None:
+            self.border_width = border_width
+        dash_style = kwargs.get('dash_style', None)
+        if dash_style is not None:
+            self.dash_style = dash_style
+        point_width = kwargs.get('point_width', None)
+        if point_width is not None:
+            self.point_width = point_width
 
         super().__init__(**kwargs)
 
@@ -60,9 +118,12 @@ class BarData(CartesianData):
 
     @border_width.setter
     def border_width(self, value):
-        self._border_width = validators.numeric(value,
-                                                allow_empty = True,
-                                                minimum = 0)
+        if value is None or (isinstance(value, (int, float, Decimal)) and value >= 0):
+            self._border_width = value
+        else:
+            self._border_width = validators.numeric(value,
+                                                    allow_empty = True,
+                                                    minimum = 0)
 
     @property
     def dash_style(self) -> Optional[str]:
@@ -92,7 +153,8 @@ class BarData(CartesianData):
         if not value:
             self._dash_style = None
         else:
-            value = validators.string(value)
+            if not isinstance(value, str):
+                value = validators.string(value)
             if value not in constants.SUPPORTED_DASH_STYLE_VALUES:
                 raise errors.HighchartsValueError(f'dash_style expects a recognized value'
                                                   f', but received: {value}')
@@ -119,7 +181,10 @@ class BarData(CartesianData):
 
     @point_width.setter
     def point_width(self, value):
-        self._point_width = validators.numeric(value, allow_empty = True)
+        if value is None or isinstance(value, (int, float, Decimal)):
+            self._point_width = value
+        else:
+            self._point_width = validators.numeric(value, allow_empty = True)
 
     @classmethod
     def from_ndarray(cls, value):
@@ -144,48 +209,22 @@ class BarData(CartesianData):
         :rtype: :class:`dict <python:dict>`
 
         """
-        kwargs = {
-            'accessibility': as_dict.get('accessibility', None),
-            'class_name': as_dict.get('className', None),
-            'color': as_dict.get('color', None),
-            'color_index': as_dict.get('colorIndex', None),
-            'custom': as_dict.get('custom', None),
-            'description': as_dict.get('description', None),
-            'events': as_dict.get('events', None),
-            'id': as_dict.get('id', None),
-            'label_rank': as_dict.get('labelRank',
-                                      None) or as_dict.get('labelrank',
-                                                           None),
-            'name': as_dict.get('name', None),
-            'selected': as_dict.get('selected', None),
-
-            'data_labels': as_dict.get('dataLabels', None),
-            'drag_drop': as_dict.get('dragDrop', None),
-            'drilldown': as_dict.get('drilldown', None),
-            'marker': as_dict.get('marker', None),
-            'x': as_dict.get('x', None),
-            'y': as_dict.get('y', None),
-
-            'border_color': as_dict.get('borderColor', None),
-            'border_width': as_dict.get('borderWidth', None),
-            'dash_style': as_dict.get('dashStyle', None),
-            'point_width': as_dict.get('pointWidth', None),
-        }
+        kwargs = get_kwargs_from_key_map(as_dict, _BAR_DATA_KEY_MAP)
+        kwargs['label_rank'] = (as_dict.get('labelRank', None) or
+                                as_dict.get('labelrank', None))
 
         return kwargs
 
     def _to_untrimmed_dict(self, in_cls = None) -> dict:
+        parent_as_dict = super()._to_untrimmed_dict(in_cls = in_cls) or {}
         untrimmed = {
             'borderColor': self.border_color,
             'borderWidth': self.border_width,
             'dashStyle': self.dash_style,
             'pointWidth': self.point_width,
+            **parent_as_dict,
         }
 
-        parent_as_dict = super()._to_untrimmed_dict(in_cls = in_cls) or {}
-        for key in parent_as_dict:
-            untrimmed[key] = parent_as_dict[key]
-
         return untrimmed
 
 
@@ -288,44 +327,20 @@ class WaterfallData(CartesianData):
         :rtype: :class:`dict <python:dict>`
 
         """
-        kwargs = {
-            'accessibility': as_dict.get('accessibility', None),
-            'class_name': as_dict.get('className', None),
-            'color': as_dict.get('color', None),
-            'color_index': as_dict.get('colorIndex', None),
-            'custom': as_dict.get('custom', None),
-            'description': as_dict.get('description', None),
-            'events': as_dict.get('events', None),
-            'id': as_dict.get('id', None),
-            'label_rank': as_dict.get('labelRank',
-                                      None) or as_dict.get('labelrank',
-                                                           None),
-            'name': as_dict.get('name', None),
-            'selected': as_dict.get('selected', None),
-
-            'data_labels': as_dict.get('dataLabels', None),
-            'drag_drop': as_dict.get('dragDrop', None),
-            'drilldown': as_dict.get('drilldown', None),
-            'marker': as_dict.get('marker', None),
-            'x': as_dict.get('x', None),
-            'y': as_dict.get('y', None),
-
-            'is_intermediate_sum': as_dict.get('isIntermediateSum', None),
-            'is_sum': as_dict.get('isSum', None),
-        }
+        kwargs = get_kwargs_from_key_map(as_dict, _WATERFALL_DATA_KEY_MAP)
+        kwargs['label_rank'] = (as_dict.get('labelRank', None) or
+                                as_dict.get('labelrank', None))
 
         return kwargs
 
     def _to_untrimmed_dict(self, in_cls = None) -> dict:
+        parent_as_dict = super()._to_untrimmed_dict(in_cls = in_cls) or {}
         untrimmed = {
             'isIntermediateSum': self.is_intermediate_sum,
             'isSum': self.is_sum,
+            **parent_as_dict,
         }
 
-        parent_as_dict = super()._to_untrimmed_dict(in_cls = in_cls) or {}
-        for key in parent_as_dict:
-            untrimmed[key] = parent_as_dict[key]
-
         return untrimmed
 
 
@@ -375,7 +390,10 @@ class WindBarbData(CartesianData):
 
     @direction.setter
     def direction(self, value):
-        self._direction = validators.numeric(value, allow_empty = True)
+        if value is None or isinstance(value, (int, float, Decimal)):
+            self._direction = value
+        else:
+            self._direction = validators.numeric(value, allow_empty = True)
 
     @property
     def value(self) -> Optional[int | float | Decimal]:
@@ -387,7 +405,10 @@ class WindBarbData(CartesianData):
 
     @value.setter
     def value(self, value_):
-        self._value = validators.numeric(value_, allow_empty = True)
+        if value_ is None or isinstance(value_, (int, float, Decimal)):
+            self._value = value_
+        else:
+            self._value = validators.numeric(value_, allow_empty = True)
 
     @classmethod
     def _get_supported_dimensions(cls) -> List[int]:
@@ -409,37 +430,34 @@ class WindBarbData(CartesianData):
         elif not checkers.is_iterable(value):
             value = [value]
 
+        is_type = checkers.is_type
+        is_dict = checkers.is_dict
+        is_iterable = checkers.is_iterable
+        enforced_null_type = constants.EnforcedNullType
+
         collection = []
         for item in value:
-            if checkers.is_type(item, 'WindBarbData'):
+            if isinstance(item, WindBarbData) or is_type(item, 'WindBarbData'):
                 as_obj = item
-            elif checkers.is_dict(item):
+            elif is_dict(item):
                 as_obj = cls.from_dict(item)
-            elif item is None or isinstance(item, constants.EnforcedNullType):
+            elif item is None or isinstance(item, enforced_null_type):
                 as_obj = cls(x = None,
                              value = None,
                              direction = None,
                              y = None)
-            elif checkers.is_iterable(item):
+            elif is_iterable(item):
                 if len(item) == 4:
-                    as_dict = {
-                        'x': item[0],
-                        'value': item[1],
-                        'direction': item[2],
-                        'y': item[3]
-                    }
+                    x, value_, direction, y = item
+                    as_obj = cls(x = x, value = value_, direction = direction, y = y)
                 elif len(item) == 3:
-                    as_dict = {
-                        'x': item[0],
-                        'value': item[1],
-                        'direction': item[2]
-                    }
+                    x, value_, direction = item
+                    as_obj = cls(x = x, value = value_, direction = direction)
                 else:
                     raise errors.HighchartsValueError(f'data expects either a 4D or 3D '
                                                       f'collection. Collection received '
                                                       f'had {len(item)} dimensions.')
 
-                as_obj = cls.from_dict(as_dict)
                 if checkers.is_string(as_obj.x):
                     as_obj.name = as_obj.x
                     as_obj.x = None
@@ -544,44 +562,20 @@ class WindBarbData(CartesianData):
         :rtype: :class:`dict <python:dict>`
 
         """
-        kwargs = {
-            'accessibility': as_dict.get('accessibility', None),
-            'class_name': as_dict.get('className', None),
-            'color': as_dict.get('color', None),
-            'color_index': as_dict.get('colorIndex', None),
-            'custom': as_dict.get('custom', None),
-            'description': as_dict.get('description', None),
-            'events': as_dict.get('events', None),
-            'id': as_dict.get('id', None),
-            'label_rank': as_dict.get('labelRank',
-                                      None) or as_dict.get('labelrank',
-                                                           None),
-            'name': as_dict.get('name', None),
-            'selected': as_dict.get('selected', None),
-
-            'data_labels': as_dict.get('dataLabels', None),
-            'drag_drop': as_dict.get('dragDrop', None),
-            'drilldown': as_dict.get('drilldown', None),
-            'marker': as_dict.get('marker', None),
-            'x': as_dict.get('x', None),
-            'y': as_dict.get('y', None),
-
-            'direction': as_dict.get('direction', None),
-            'value': as_dict.get('value', None),
-        }
+        kwargs = get_kwargs_from_key_map(as_dict, _WINDBARB_DATA_KEY_MAP)
+        kwargs['label_rank'] = (as_dict.get('labelRank', None) or
+                                as_dict.get('labelrank', None))
 
         return kwargs
 
     def _to_untrimmed_dict(self, in_cls = None) -> dict:
+        parent_as_dict = super()._to_untrimmed_dict(in_cls = in_cls) or {}
         untrimmed = {
             'direction': self.direction,
             'value': self.value,
+            **parent_as_dict,
         }
 
-        parent_as_dict = super()._to_untrimmed_dict(in_cls = in_cls) or {}
-        for key in parent_as_dict:
-            untrimmed[key] = parent_as_dict[key]
-
         return untrimmed
 
 
@@ -653,8 +647,8 @@ class XRangeData(CartesianData):
 
     @x.setter
     def x(self, value):
-        if value is None:
-            self._x = None
+        if value is None or isinstance(value, (int, float, Decimal, datetime.date)):
+            self._x = value
         else:
             if checkers.is_datetime(value):
                 value = validators.datetime(value)
@@ -686,8 +680,8 @@ class XRangeData(CartesianData):
 
     @x2.setter
     def x2(self, value):
-        if value is None:
-            self._x2 = None
+        if value is None or isinstance(value, (int, float, Decimal, datetime.date)):
+            self._x2 = value
         else:
             if checkers.is_datetime(value):
                 value = validators.datetime(value)
@@ -712,13 +706,17 @@ class XRangeData(CartesianData):
         elif not checkers.is_iterable(value):
             value = [value]
 
+        is_type = checkers.is_type
+        is_dict = checkers.is_dict
+        enforced_null_type = constants.EnforcedNullType
+
         collection = []
         for item in value:
-            if checkers.is_type(item, 'XRangeData'):
+            if isinstance(item, XRangeData) or is_type(item, 'XRangeData'):
                 as_obj = item
-            elif checkers.is_dict(item):
+            elif is_dict(item):
                 as_obj = cls.from_dict(item)
-            elif item is None or isinstance(item, constants.EnforcedNullType):
+            elif item is None or isinstance(item, enforced_null_type):
                 as_obj = None
             else:
                 raise errors.HighchartsValueError(f'each data point supplied must either '
@@ -752,46 +750,21 @@ class XRangeData(CartesianData):
         :rtype: :class:`dict <python:dict>`
 
         """
-        kwargs = {
-            'accessibility': as_dict.get('accessibility', None),
-            'class_name': as_dict.get('className', None),
-            'color': as_dict.get('color', None),
-            'color_index': as_dict.get('colorIndex', None),
-            'custom': as_dict.get('custom', None),
-            'description': as_dict.get('description', None),
-            'events': as_dict.get('events', None),
-            'id': as_dict.get('id', None),
-            'label_rank': as_dict.get('labelRank',
-                                      None) or as_dict.get('labelrank',
-                                                           None),
-            'name': as_dict.get('name', None),
-            'selected': as_dict.get('selected', None),
-
-            'data_labels': as_dict.get('dataLabels', None),
-            'drag_drop': as_dict.get('dragDrop', None),
-            'drilldown': as_dict.get('drilldown', None),
-            'marker': as_dict.get('marker', None),
-            'x': as_dict.get('x', None),
-            'y': as_dict.get('y', None),
-
-            'partial_fill': as_dict.get('partialFill', None),
-            'x2': as_dict.get('x2', None),
-
-        }
+        kwargs = get_kwargs_from_key_map(as_dict, _XRANGE_DATA_KEY_MAP)
+        kwargs['label_rank'] = (as_dict.get('labelRank', None) or
+                                as_dict.get('labelrank', None))
 
         return kwargs
 
     def _to_untrimmed_dict(self, in_cls = None) -> dict:
+        parent_as_dict = super()._to_untrimmed_dict(in_cls = in_cls) or {}
         untrimmed = {
             'partialFill': self.partial_fill,
             'x': self.x,
             'x2': self.x2,
+            **parent_as_dict,
         }
 
-        parent_as_dict = super()._to_untrimmed_dict(in_cls = in_cls) or {}
-        for key in parent_as_dict:
-            untrimmed[key] = parent_as_dict[key]
-
         return untrimmed
 
 
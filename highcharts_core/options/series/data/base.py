@@ -697,15 +697,27 @@ class DataBase(DataCore):
           descendant instances or 
           :class:`CartesianDataCollection <highcharts_core.options.series.data.cartesian.CartesianDataCollection>`
         """
-        if not utility_functions.is_ndarray(value) and not value:
+        if value is None:
             return []
         elif utility_functions.is_ndarray(value):
             return cls.from_ndarray(value)
+        elif hasattr(value, '__len__'):
+            if len(value) == 0:
+                return []
+        elif not value:
+            return []
 
         if checkers.is_type(value, 'DataPointCollection'):
             return value
         elif isinstance(value, dict) and 'dataPoints' in value:
             return cls.from_list(value['dataPoints'])
+        elif (
+            hasattr(value, '__len__') and
+            not isinstance(value, (list, tuple, str, bytes, dict, UserDict))
+        ):
+            # Other sized iterables (e.g. a pandas Series) may not support bool(), which
+            # the from_list() implementations rely on.
+            value = list(value)
 
         return cls.from_list(value)
 
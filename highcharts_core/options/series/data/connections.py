@@ -353,13 +353,17 @@ class WeightedConnectionData(ConnectionData):
         elif not checkers.is_iterable(value):
             value = [value]
 
+        is_type = checkers.is_type
+        is_dict = checkers.is_dict
+        enforced_null_type = constants.EnforcedNullType
+
         collection = []
         for item in value:
-            if checkers.is_type(item, 'ConnectionData'):
+            if isinstance(item, ConnectionData) or is_type(item, 'ConnectionData'):
                 as_obj = item
-            elif checkers.is_dict(item):
+            elif is_dict(item):
                 as_obj = cls.from_dict(item)
-            elif item is None or isinstance(item, constants.EnforcedNullType):
+            elif item is None or isinstance(item, enforced_null_type):
                 as_obj = cls()
             else:
                 raise errors.HighchartsValueError(f'each data point supplied must either '
@@ -6,6 +6,7 @@ import string
 import random
 import typing
 from collections import UserDict
+from functools import lru_cache
 
 from validator_collection import validators, checkers
 try:
@@ -85,13 +86,25 @@ def get_remaining_mro(cls,
       the MRO for ``cls``.
     :rtype: :class:`list <python:list>` of ``type`` objects
     """
+    return list(_get_remaining_mro(cls, in_cls = in_cls, method = method))
+
+
+@lru_cache(maxsize = None)
+def _get_remaining_mro(cls, in_cls = None, method = '_to_untrimmed_dict'):
+    """Cached implementation of :func:`get_remaining_mro`.
+
+    A class's MRO cannot change once the class has been created, so the result is
+    computed once per ``(cls, in_cls, method)`` combination.
+
+    :rtype: :class:`tuple <python:tuple>` of ``type`` objects
+    """
     mro = [x for x in cls.mro()
            if hasattr(x, method) and x.__name__ != 'HighchartsMeta']
     if in_cls is None:
-        return mro[1:]
+        return tuple(mro[1:])
     else:
         index = mro.index(in_cls)
-        return mro[(index + 1):]
+        return tuple(mro[(index + 1):])
 
 
 def mro__to_untrimmed_dict(obj, in_cls = None):
@@ -112,24 +125,107 @@ def mro__to_untrimmed_dict(obj, in_cls = None):
     do not repeat for each class
     """
     cls = obj.__class__
-    remaining_mro = get_remaining_mro(cls,
-                                      in_cls = in_cls,
-                                      method = '_to_untrimmed_dict')
+    remaining_mro = _get_remaining_mro(cls,
+                                       in_cls = in_cls,
+                                       method = '_to_untrimmed_dict')
 
-    ancestor_dicts = []
+    consolidated = {}
     for x in remaining_mro:
         if hasattr(x, '_to_untrimmed_dict') and x != cls:
-            ancestor_dicts.append(x._to_untrimmed_dict(obj,
-                                                       in_cls = x))
-
-    consolidated = {}
-    for item in ancestor_dicts:
-        for key in item:
-            consolidated[key] = item[key]
+            consolidated.update(x._to_untrimmed_dict(obj, in_cls = x))
 
     return consolidated
 
 
+def build_key_map(*tables, exclude = ()):
+    """Flatten one or more ``(key, camel_key)`` tables into the lookup structure used by
+    :func:`get_kwargs_from_key_map`.
+
+    :param tables: One or more :class:`tuple <python:tuple>` of ``(key, camel_key)``
+      pairs, where ``key`` is the keyword argument name and ``camel_key`` is the
+      corresponding key in the JavaScript / JSON representation.
+
+    :param exclude: Keyword argument names to leave out of the result, for classes that
+      do not support every key in the tables they build on. Defaults to an empty
+      :class:`tuple <python:tuple>`.
+    :type exclude: iterable of :class:`str <python:str>`
+
+    :returns: A :class:`dict <python:dict>` of every keyword argument (in table order)
+      set to :obj:`None <python:None>`, and a :class:`dict <python:dict>` mapping each
+      camelCase key to its keyword argument name.
+    :rtype: :class:`tuple <python:tuple>` of :class:`dict <python:dict>` and
+      :class:`dict <python:dict>`
+    """
+    pairs = [(key, camel_key) for table in tables for key, camel_key in table
+             if key not in exclude]
+    defaults = dict.fromkeys(key for key, camel_key in pairs)
+    camel_to_key = {camel_key: key for key, camel_key in pairs}
+
+    return defaults, camel_to_key
+
+
+def get_kwargs_from_key_map(as_dict, key_map):
+    """Assemble the keyword arguments for an object from ``as_dict``.
+
+    Every keyword argument in ``key_map`` is present in the result, defaulting to
+    :obj:`None <python:None>`. Only the keys actually present in ``as_dict`` are looked
+    up, rather than probing ``as_dict`` once per supported key.
+
+    :param as_dict: The camelCase :class:`dict <python:dict>` being de-serialized.
+    :type as_dict: :class:`dict <python:dict>`
+
+    :param key_map: The lookup structure returned by :func:`build_key_map`.
+
+    :rtype: :class:`dict <python:dict>`
+    """
+    defaults, camel_to_key = key_map
+    kwargs = defaults.copy()
+    for camel_key, value in as_dict.items():
+        key = camel_to_key.get(camel_key)
+        if key is not None:
+            kwargs[key] = value
+
+    return kwargs
+
+
+def data_from_array(data_cls, value):
+    """Return the data points for a series ``data`` setter, re-using the points as-is
+    when ``value`` is already a :class:`list <python:list>` of ``data_cls`` instances.
+
+    Empty values resolve to :obj:`None <python:None>`. Sized values are checked by
+    length rather than truthiness, so objects like a :class:`pandas.Series` (whose
+    truth value is ambiguous) are not evaluated with :func:`bool <python:bool>`.
+
+    Points are only re-used when their type is exactly ``data_cls`` (sub-classes are
+    re-parsed) and their ``x`` (if any) is not a :class:`str <python:str>`, since
+    ``from_list()`` moves such an ``x`` into ``name`` for some data point classes.
+
+    :param data_cls: The data point class that the series uses.
+    :type data_cls: :class:`DataBase <highcharts_core.options.series.data.base.DataBase>`
+      descendent
+
+    :param value: The value supplied to the series' ``data`` setter.
+
+    :rtype: :class:`list <python:list>` of ``data_cls`` instances,
+      :class:`DataPointCollection <highcharts_core.options.series.data.collections.DataPointCollection>`,
+      or :obj:`None <python:None>`
+    """
+    if value is None:
+        return None
+    elif hasattr(value, '__len__'):
+        if not is_ndarray(value) and len(value) == 0:
+            return None
+    elif not value:
+        return None
+
+    if isinstance(value, list) and all(type(item) is data_cls and
+                                       not isinstance(getattr(item, 'x', None), str)
+                                       for item in value):
+        return list(value)
+
+    return data_cls.from_array(value)
+
+
 def validate_color(value):
     """Validate that ``value`` is either a :class:`Gradient`, :class:`Pattern`, or a
     :class:`str <python:str>`.
@@ -145,35 +241,43 @@ def validate_color(value):
 
     if not value:
         return None
+    elif isinstance(value, str):
+        if 'linearGradient' in value or 'radialGradient' in value:
+            try:
+                value = Gradient.from_json(value)
+            except (TypeError, ValueError):
+                value = validators.string(value)
+        # also covers 'patternOptions'
+        elif 'pattern' in value:
+            try:
+                value = Pattern.from_json(value)
+            except (TypeError, ValueError):
+                value = validators.string(value)
+        else:
+            value = validators.string(value)
+    elif isinstance(value, dict):
+        if 'linearGradient' in value or 'radialGradient' in value:
+            try:
+                value = Gradient.from_json(value)
+            except (TypeError, ValueError):
+                value = Gradient.from_dict(value)
+        elif 'linear_gradient' in value or 'radial_gradient' in value:
+            value = Gradient(**value)
+        elif 'patternOptions' in value or 'pattern' in value:
+            try:
+                value = Pattern.from_json(value)
+            except (TypeError, ValueError):
+                value = Pattern.from_dict(value)
+        elif 'pattern_options' in value:
+            value = Pattern(**value)
+        else:
+            raise errors.HighchartsValueError(f'Unable to resolve value to a string, '
+                                              f'Gradient, or Pattern. Value received '
+                                              f'was: {value}')
     elif value.__class__.__name__ == 'EnforcedNullType':
         return value
     elif isinstance(value, (Gradient, Pattern)):
         return value
-    elif isinstance(value, (dict, str)) and ('linearGradient' in value or
-                                             'radialGradient' in value):
-        try:
-            value = Gradient.from_json(value)
-        except (TypeError, ValueError):
-            if isinstance(value, dict):
-                value = Gradient.from_dict(value)
-            else:
-                value = validators.string(value)
-    elif isinstance(value, dict) and ('linear_gradient' in value or
-                                      'radial_gradient' in value):
-        value = Gradient(**value)
-    elif isinstance(value, (dict, str)) and ('patternOptions' in value or
-                                             'pattern' in value):
-        try:
-            value = Pattern.from_json(value)
-        except (TypeError, ValueError):
-            if isinstance(value, dict):
-                value = Pattern.from_dict(value)
-            else:
-                value = validators.string(value)
-    elif isinstance(value, dict) and 'pattern_options' in value:
-        value = Pattern(**value)
-    elif isinstance(value, str):
-        value = validators.string(value)
     else:
         raise errors.HighchartsValueError(f'Unable to resolve value to a string, '
                                           f'Gradient, or Pattern. Value received '
@@ -194,9 +298,22 @@ def to_camelCase(snake_case):
     """
     if not snake_case:
         raise errors.HighchartsValueError(f'snake_case cannot be empty')
-    
-    snake_case = str(snake_case)
 
+    return _to_camelCase(str(snake_case))
+
+
+@lru_cache(maxsize = 4096)
+def _to_camelCase(snake_case):
+    """Cached implementation of :func:`to_camelCase`.
+
+    The conversion depends only on ``snake_case``, and the same option names are
+    converted on every call to ``from_dict()``, so each result is computed once.
+
+    :param snake_case: A non-empty :class:`str <python:str>`.
+    :type snake_case: :class:`str <python:str>`
+
+    :rtype: :class:`str <python:str>`
+    """
     if '_' not in snake_case:
         return snake_case
 
@@ -5,6 +5,7 @@ import pytest
 from json.decoder import JSONDecodeError
 
 from highcharts_core.options.annotations import Annotation as cls
+from highcharts_core.options.annotations.points import AnnotationPoint
 from highcharts_core import errors
 from tests.fixtures import input_files, check_input_file, to_camelCase, to_js_dict, \
     Class__init__, Class__to_untrimmed_dict, Class_from_dict, Class_to_dict, \
@@ -261,4 +262,50 @@ def test_71_draggable_empty_string(draggable, error):
         assert result.draggable == draggable
     else:
         with pytest.raises(error):
-            result = cls(draggable = draggable)
\ No newline at end of file
+            result = cls(draggable = draggable)
+
+
+@pytest.mark.parametrize('value, expected, error', [
+    ('5', 5, None),
+    ('-3', -3, None),
+    ('', None, None),
+    ('5.0', 5, None),
+    ('+1', 1, None),
+    (' 1', 1, None),
+    ('1.5', '1.5', None),
+    ('abc', 'abc', None),
+    (3, 3, None),
+    (3.5, None, TypeError),
+    ([1], None, TypeError),
+])
+@pytest.mark.parametrize('attribute', ['x_axis', 'y_axis'])
+def test_AnnotationPoint_axis(attribute, value, expected, error):
+    if not error:
+        result = AnnotationPoint(**{attribute: value})
+        assert getattr(result, attribute) == expected
+        assert type(getattr(result, attribute)) is type(expected)
+    else:
+        with pytest.raises(error):
+            result = AnnotationPoint(**{attribute: value})
+
+
+@pytest.mark.parametrize('value, expected, error', [
+    (None, None, None),
+    (3, 3, None),
+    (3.5, 3.5, None),
+    ('5', 5.0, None),
+    ('-3.5', -3.5, None),
+    ('1e3', 1000.0, None),
+    ('', None, TypeError),
+    ('abc', None, TypeError),
+    ([1], None, TypeError),
+])
+@pytest.mark.parametrize('attribute', ['x', 'y'])
+def test_AnnotationPoint_coordinate(attribute, value, expected, error):
+    if not error:
+        result = AnnotationPoint(**{attribute: value})
+        assert getattr(result, attribute) == expected
+        assert type(getattr(result, attribute)) is type(expected)
+    else:
+        with pytest.raises(error):
+            result = AnnotationPoint(**{attribute: value})
@@ -23,7 +23,7 @@ from highcharts_core.options.series.bar import XRangeSeries as cls10
 from highcharts_core import errors
 from tests.fixtures import input_files, check_input_file, to_camelCase, to_js_dict, \
     Class__init__, Class__to_untrimmed_dict, Class_from_dict, Class_to_dict, \
-    Class_from_js_literal
+    Class_from_js_literal, run_pandas_tests
 
 
 STANDARD_PARAMS = [
@@ -1043,6 +1043,31 @@ def test_ColumnSeries_from_js_literal(input_files, filename, as_file, error):
     Class_from_js_literal(cls3, input_files, filename, as_file, error)
 
 
+@pytest.mark.parametrize('subclass', [cls3, cls6])
+def test_ColumnSeries_inherits_BarSeries_kwargs(subclass):
+    as_dict = {
+        'borderColor': '#ccc',
+        'depth': 25,
+        'edgeColor': '#999',
+        'edgeWidth': 2,
+        'groupZPadding': 1,
+        'id': 'some-id',
+        'pointPadding': 0.1
+    }
+
+    assert subclass._get_kwargs_from_dict(dict(as_dict)) == \
+        cls2._get_kwargs_from_dict(dict(as_dict))
+
+    expected = cls2.from_dict(dict(as_dict)).to_dict()
+    result = subclass.from_dict(dict(as_dict)).to_dict()
+    expected.pop('type', None)
+    result.pop('type', None)
+
+    assert result == expected
+    for key in as_dict:
+        assert result[key] == as_dict[key]
+
+
 # NEXT CLASS!
 
 STANDARD_PARAMS_4 = [
@@ -6442,3 +6467,37 @@ def test_XRangeSeries_to_dict(kwargs, error):
 ])
 def test_XRangeSeries_from_js_literal(input_files, filename, as_file, error):
     Class_from_js_literal(cls10, input_files, filename, as_file, error)
+
+
+BAR_SERIES_DATA = [
+    (cls, [1, 2]),
+    (cls2, [1, 2]),
+    (cls3, [1, 2]),
+    (cls4, [1, 2]),
+    (cls5, [[0, 1, 2], [1, 2, 3]]),
+    (cls6, [1, 2]),
+    (cls7, [[0, 1, 2], [1, 2, 3]]),
+    (cls8, [1, 2]),
+    (cls9, [[0, 1, 2], [1, 2, 3]]),
+    (cls10, [{'x': 0, 'x2': 1, 'y': 0}]),
+]
+
+
+@pytest.mark.parametrize('series_cls, data', BAR_SERIES_DATA)
+@pytest.mark.parametrize('value', [(), []])
+def test_bar_series_data_setter_empty(series_cls, data, value):
+    assert series_cls(data = value).data is None
+
+
+@pytest.mark.parametrize('series_cls, data', BAR_SERIES_DATA)
+def test_bar_series_data_setter_pandas(run_pandas_tests, series_cls, data):
+    if not run_pandas_tests:
+        return
+
+    import pandas
+
+    assert series_cls(data = pandas.Series([], dtype = object)).data is None
+
+    from_series = series_cls(data = pandas.Series(data))
+    from_list = series_cls(data = data)
+    assert from_series.to_dict() == from_list.to_dict()
@@ -5,10 +5,12 @@ import pytest
 from json.decoder import JSONDecodeError
 
 from highcharts_core.options.series.dependencywheel import DependencyWheelSeries as cls
+from highcharts_core.options.series.data.connections import WeightedConnectionData, \
+    OutgoingWeightedConnectionData
 from highcharts_core import errors
 from tests.fixtures import input_files, check_input_file, to_camelCase, to_js_dict, \
     Class__init__, Class__to_untrimmed_dict, Class_from_dict, Class_to_dict, \
-    Class_from_js_literal
+    Class_from_js_literal, run_pandas_tests
 
 STANDARD_PARAMS = [
     ({}, None),
@@ -1273,3 +1275,48 @@ def test_to_dict(kwargs, error):
 ])
 def test_from_js_literal(input_files, filename, as_file, error):
     Class_from_js_literal(cls, input_files, filename, as_file, error)
+
+
+def test_data_reuses_typed_points(monkeypatch):
+    calls = []
+    original = WeightedConnectionData.from_array.__func__
+
+    def spy(klass, value):
+        calls.append(value)
+        return original(klass, value)
+
+    monkeypatch.setattr(WeightedConnectionData, 'from_array', classmethod(spy))
+
+    points = [WeightedConnectionData(from_ = 'a', to = 'b', weight = 1),
+              WeightedConnectionData(from_ = 'b', to = 'c', weight = 2)]
+    result = cls(data = points)
+    assert calls == []
+    assert result.data is not points
+    assert len(result.data) == len(points)
+    for item, point in zip(result.data, points):
+        assert item is point
+
+    subclassed = [OutgoingWeightedConnectionData(from_ = 'a', to = 'b', weight = 1,
+                                                 outgoing = True)]
+    result = cls(data = subclassed)
+    assert calls
+    assert all(value is subclassed for value in calls)
+    assert len(result.data) == 1
+
+
+@pytest.mark.parametrize('value', [None, (), []])
+def test_data_empty_values(value):
+    assert cls(data = value).data is None
+
+
+def test_data_from_pandas_series(run_pandas_tests):
+    if not run_pandas_tests:
+        return
+
+    import pandas
+
+    data = [{'from': 'a', 'to': 'b', 'weight': 1},
+            {'from': 'b', 'to': 'c', 'weight': 2}]
+
+    assert cls(data = pandas.Series([], dtype = object)).data is None
+    assert cls(data = pandas.Series(data)).to_dict() == cls(data = data).to_dict()
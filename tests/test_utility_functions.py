@@ -46,6 +46,42 @@ def test_to_snake_case(camelCase, expected, error):
             result = utility_functions.to_snake_case(camelCase)
 
 
+@pytest.mark.parametrize('value, expected_type, error', [
+    (None, type(None), None),
+    ('', type(None), None),
+    ('#ccc', str, None),
+    ('rgba(255, 255, 255, 0.5)', str, None),
+    ({'linearGradient': {'x1': 0, 'x2': 0, 'y1': 0, 'y2': 1},
+      'stops': [[0, '#003399'], [1, '#3366AA']]}, 'Gradient', None),
+    ('{"linearGradient": {"x1": 0, "x2": 0, "y1": 0, "y2": 1}, "stops": [[0, "#003399"], [1, "#3366AA"]]}', 'Gradient', None),
+    ({'patternOptions': {'path': 'M 0 0 L 10 10', 'width': 10, 'height': 10}}, 'Pattern', None),
+    (123, None, ValueError),
+])
+def test_validate_color(value, expected_type, error):
+    if not error:
+        result = utility_functions.validate_color(value)
+        if isinstance(expected_type, str):
+            assert checkers.is_type(result, expected_type) is True
+        else:
+            assert isinstance(result, expected_type) is True
+    else:
+        with pytest.raises(error):
+            result = utility_functions.validate_color(value)
+
+
+@pytest.mark.parametrize('as_dict, exclude, expected', [
+    ({}, (), {'some_key': None, 'other_key': None}),
+    ({'someKey': 123, 'unknownKey': 456}, (), {'some_key': 123, 'other_key': None}),
+    ({'someKey': 123, 'otherKey': 456}, ('other_key', ), {'some_key': 123}),
+])
+def test_get_kwargs_from_key_map(as_dict, exclude, expected):
+    key_map = utility_functions.build_key_map((('some_key', 'someKey'), ),
+                                              (('other_key', 'otherKey'), ),
+                                              exclude = exclude)
+    result = utility_functions.get_kwargs_from_key_map(as_dict, key_map)
+    assert result == expected
+
+
 if HAS_NUMPY:
     @pytest.mark.parametrize('value, expected_dtype, error', [
         ([1, 2, 3], [np.int32, np.int64], None),